@@ -2,14 +2,14 @@ import json
 import os
 import unittest
 from pathlib import Path
-from typing import TypeVar
+from typing import TypeVar, Union
 from unittest.mock import Mock, patch
 
 import pytest
 
 from huggingface_hub import HfApi, hf_hub_download
 from huggingface_hub.hub_mixin import PyTorchModelHubMixin
-from huggingface_hub.utils import SoftTemporaryDirectory, is_torch_available
+from huggingface_hub.utils import is_torch_available
 
 from .testing_constants import ENDPOINT_STAGING, TOKEN, USER
 from .testing_utils import repo_name
@@ -32,6 +32,7 @@ def require_torch(test_case):
 
 if is_torch_available():
     CONFIG = {"num": 10, "act": "gelu_fast"}
+    CONFIG_AS_BYTES = json.dumps(CONFIG).encode()  # as written by `save_pretrained`
 
     class DummyModel(nn.Module, PyTorchModelHubMixin):
         def __init__(self, **kwargs):
@@ -50,26 +51,38 @@ else:
 @pytest.mark.usefixtures("fx_cache_dir")
 class HubMixingTest(unittest.TestCase):
     cache_dir: Path
+    model: DummyModel
 
     @classmethod
     def setUpClass(cls):
         """
         Share this valid token in all tests below.
+
+        Also share a single model instance across tests that only save or push it (i.e. that do not mutate it).
         """
         cls._api = HfApi(endpoint=ENDPOINT_STAGING, token=TOKEN)
-
-    def test_save_pretrained_basic(self):
-        DummyModel().save_pretrained(self.cache_dir)
-        files = os.listdir(self.cache_dir)
-        self.assertTrue("pytorch_model.bin" in files)
-        self.assertEqual(len(files), 1)
-
-    def test_save_pretrained_with_config(self):
-        DummyModel().save_pretrained(self.cache_dir, config=CONFIG)
-        files = os.listdir(self.cache_dir)
-        self.assertTrue("config.json" in files)
-        self.assertTrue("pytorch_model.bin" in files)
-        self.assertEqual(len(files), 2)
+        cls.model = DummyModel()
+
+    def assert_valid_config_json(self, path: Union[str, Path]) -> None:
+        # Compare raw bytes: no need to parse the file to check its content
+        self.assertEqual(Path(path).read_bytes(), CONFIG_AS_BYTES)
+
+    def assert_no_config_json(self, save_directory: Path) -> None:
+        self.assertFalse((save_directory / "config.json").exists())
+
+    def test_save_pretrained(self):
+        # Cases share the same `cache_dir` fixture, each one saving in its own subfolder
+        for name, config in (("basic", None), ("with_config", CONFIG)):
+            with self.subTest(name):
+                save_directory = self.cache_dir / name
+                self.model.save_pretrained(save_directory, config=config)
+                self.assertTrue((save_directory / "pytorch_model.bin").is_file())
+                if config is None:
+                    self.assert_no_config_json(save_directory)
+                    self.assertEqual(len(os.listdir(save_directory)), 1)
+                else:
+                    self.assert_valid_config_json(save_directory / "config.json")
+                    self.assertEqual(len(os.listdir(save_directory)), 2)
 
     def test_save_pretrained_with_push_to_hub(self):
         repo_id = repo_name("save")
@@ -80,57 +93,39 @@ class HubMixingTest(unittest.TestCase):
         mocked_model.push_to_hub = Mock()
         mocked_model._save_pretrained = Mock()  # disable _save_pretrained to speed-up
 
-        # Not pushed to hub
-        mocked_model.save_pretrained(save_directory)
-        mocked_model.push_to_hub.assert_not_called()
+        # disable directory creation and config serialization to disk as well
+        with patch.object(Path, "mkdir"), patch.object(Path, "write_text"):
+            # Not pushed to hub
+            mocked_model.save_pretrained(save_directory)
+            mocked_model.push_to_hub.assert_not_called()
 
-        # Push to hub with repo_id
-        mocked_model.save_pretrained(save_directory, push_to_hub=True, repo_id="CustomID", config=config)
-        mocked_model.push_to_hub.assert_called_with(repo_id="CustomID", config=config)
-
-        # Push to hub with default repo_id (based on dir name)
-        mocked_model.save_pretrained(save_directory, push_to_hub=True, config=config)
-        mocked_model.push_to_hub.assert_called_with(repo_id=repo_id, config=config)
-
-    @patch.object(DummyModel, "_from_pretrained")
-    def test_from_pretrained_model_id_only(self, from_pretrained_mock: Mock) -> None:
-        model = DummyModel.from_pretrained("namespace/repo_name")
-        from_pretrained_mock.assert_called_once()
-        self.assertIs(model, from_pretrained_mock.return_value)
+            # Push to hub with repo_id
+            mocked_model.save_pretrained(save_directory, push_to_hub=True, repo_id="CustomID", config=config)
+            mocked_model.push_to_hub.assert_called_with(repo_id="CustomID", config=config)
 
-    @patch.object(DummyModel, "_from_pretrained")
-    def test_from_pretrained_model_id_and_revision(self, from_pretrained_mock: Mock) -> None:
-        """Regression test for #1313.
-        See https://github.com/huggingface/huggingface_hub/issues/1313."""
-        model = DummyModel.from_pretrained("namespace/repo_name", revision="123456789")
-        from_pretrained_mock.assert_called_once_with(
-            model_id="namespace/repo_name",
-            revision="123456789",  # Revision is passed correctly!
-            cache_dir=None,
-            force_download=False,
-            proxies=None,
-            resume_download=False,
-            local_files_only=False,
-            token=None,
-        )
-        self.assertIs(model, from_pretrained_mock.return_value)
+            # Push to hub with default repo_id (based on dir name)
+            mocked_model.save_pretrained(save_directory, push_to_hub=True, config=config)
+            mocked_model.push_to_hub.assert_called_with(repo_id=repo_id, config=config)
 
     def test_from_pretrained_to_relative_path(self):
-        with SoftTemporaryDirectory(dir=Path(".")) as tmp_relative_dir:
-            relative_save_directory = Path(tmp_relative_dir) / "model"
-            DummyModel().save_pretrained(relative_save_directory, config=CONFIG)
-            model = DummyModel.from_pretrained(relative_save_directory)
-            self.assertDictEqual(model.config, CONFIG)
+        # Resolve the relative path from `cache_dir` instead of creating an extra tmp dir in the current directory
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.cache_dir)
+
+        relative_save_directory = Path("model")
+        self.model.save_pretrained(relative_save_directory, config=CONFIG)
+        model = DummyModel.from_pretrained(relative_save_directory)
+        self.assertDictEqual(model.config, CONFIG)
 
     def test_from_pretrained_to_absolute_path(self):
         save_directory = self.cache_dir / "subfolder"
-        DummyModel().save_pretrained(save_directory, config=CONFIG)
+        self.model.save_pretrained(save_directory, config=CONFIG)
         model = DummyModel.from_pretrained(save_directory)
         self.assertDictEqual(model.config, CONFIG)
 
     def test_from_pretrained_to_absolute_string_path(self):
         save_directory = str(self.cache_dir / "subfolder")
-        DummyModel().save_pretrained(save_directory, config=CONFIG)
+        self.model.save_pretrained(save_directory, config=CONFIG)
         model = DummyModel.from_pretrained(save_directory)
         self.assertDictEqual(model.config, CONFIG)
 
@@ -151,9 +146,11 @@ class HubMixingTest(unittest.TestCase):
             "`PyTorchModelHubMixin.from_pretrained` return type annotation is not a TypeVar bound by `ModelHubMixin`.",
         )
 
+    @pytest.mark.network
+    @pytest.mark.xdist_group(name="hub_mixin_net")
     def test_push_to_hub(self):
         repo_id = f"{USER}/{repo_name('push_to_hub')}"
-        DummyModel().push_to_hub(repo_id=repo_id, api_endpoint=ENDPOINT_STAGING, token=TOKEN, config=CONFIG)
+        self.model.push_to_hub(repo_id=repo_id, api_endpoint=ENDPOINT_STAGING, token=TOKEN, config=CONFIG)
 
         # Test model id exists
         model_info = self._api.model_info(repo_id)
@@ -166,8 +163,45 @@ class HubMixingTest(unittest.TestCase):
             use_auth_token=TOKEN,
             cache_dir=self.cache_dir,
         )
-        with open(tmp_config_path) as f:
-            self.assertDictEqual(json.load(f), CONFIG)
+        self.assert_valid_config_json(tmp_config_path)
 
         # Delete repo
         self._api.delete_repo(repo_id=repo_id)
+
+
+@require_torch
+class HubMixingFromPretrainedMockedTest(unittest.TestCase):
+    _fp_mock: Mock
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Patch `DummyModel._from_pretrained` once for all tests below.
+        """
+        cls._fp_patcher = patch.object(DummyModel, "_from_pretrained")
+        cls._fp_mock = cls._fp_patcher.start()
+        cls.addClassCleanup(cls._fp_patcher.stop)
+
+    def setUp(self) -> None:
+        self._fp_mock.reset_mock()
+
+    def test_from_pretrained_model_id_only(self) -> None:
+        model = DummyModel.from_pretrained("namespace/repo_name")
+        self._fp_mock.assert_called_once()
+        self.assertIs(model, self._fp_mock.return_value)
+
+    def test_from_pretrained_model_id_and_revision(self) -> None:
+        """Regression test for #1313.
+        See https://github.com/huggingface/huggingface_hub/issues/1313."""
+        model = DummyModel.from_pretrained("namespace/repo_name", revision="123456789")
+        self._fp_mock.assert_called_once_with(
+            model_id="namespace/repo_name",
+            revision="123456789",  # Revision is passed correctly!
+            cache_dir=None,
+            force_download=False,
+            proxies=None,
+            resume_download=False,
+            local_files_only=False,
+            token=None,
+        )
+        self.assertIs(model, self._fp_mock.return_value)
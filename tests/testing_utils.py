@@ -61,10 +61,17 @@ def repo_name(id: Optional[str] = None, prefix: str = "repo") -> str:
 
     >>> repo_name("my-space", prefix='space')
     space-my-space-16599481979701
+
+    >>> # with PYTEST_XDIST_WORKER=gw0 (set by pytest-xdist), the worker id is appended to avoid collisions
+    >>> repo_name("my-space", prefix='space')
+    space-my-space-16599481979701-gw0
     """
     if id is None:
         id = uuid.uuid4().hex[:6]
     ts = int(time.time() * 10e3)
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if worker is not None:
+        return f"{prefix}-{id}-{ts}-{worker}"
     return f"{prefix}-{id}-{ts}"
 
 